@@ -8,13 +8,76 @@ the CLI.
 from abc import ABC, abstractmethod
 
 import numpy as np
-from skimage.transform import AffineTransform
 
 from pychubby.base import DisplacementField
 from pychubby.detect import LANDMARK_NAMES, LandmarkFace, LandmarkFaces
 from pychubby.reference import DefaultRS
 
 
+def _compile_specs(specs):
+    """Compile a spec dictionary into NumPy arrays.
+
+    Meant to be run once at import time for actions whose specs are constant,
+    so that landmark-name resolution and array construction are hoisted out
+    of ``perform``.
+
+    Parameters
+    ----------
+    specs : dict
+        Dictionary where keys represent either the index or a name of the
+        landmark and values are `(angle, prop)` tuples.
+
+    Returns
+    -------
+    compiled : tuple
+        Tuple `(keys, dirs, props)` where `keys` is an array of length
+        `len(specs)` holding the resolved landmark indices, `dirs` is an array
+        of shape `(len(specs), 2)` holding the unit direction vectors of the
+        shifts and `props` is an array of length `len(specs)` holding the
+        proportional shifts.
+
+    """
+    keys = np.array(
+        [k if isinstance(k, int) else LANDMARK_NAMES[k] for k in specs],
+        dtype=np.intp,
+    )
+    angles_rad = np.radians([angle for angle, _ in specs.values()])
+    dirs = np.stack([np.cos(angles_rad), np.sin(angles_rad)], axis=1)
+    props = np.array([prop for _, prop in specs.values()])
+
+    return keys, dirs, props
+
+
+def _estimate_cached(reference_space, lf):
+    """Estimate a reference space for a face, reusing a previous estimate.
+
+    The estimate together with the forward mapping of all landmarks is stored
+    on the reference space itself, so that chained actions sharing a reference
+    space only pay for the least-squares fit once per face.
+
+    Parameters
+    ----------
+    reference_space : ReferenceSpace
+        Instance of a ``ReferenceSpace``. Becomes a stateful cache.
+
+    lf : LandmarkFace
+        Instance of a ``LandmarkFace``.
+
+    Returns
+    -------
+    ref_points : np.ndarray
+        Array of shape `(68, 2)` representing all landmarks of `lf` in the
+        reference space.
+
+    """
+    if getattr(reference_space, '_cached_for', None) is not lf:
+        reference_space.estimate(lf)
+        reference_space._cached_ref_points = reference_space.inp2ref(lf.points)
+        reference_space._cached_for = lf
+
+    return reference_space._cached_ref_points
+
+
 class Action(ABC):
     """General Action class to be subclassed."""
 
@@ -38,6 +101,71 @@ class Action(ABC):
 
         """
 
+    def perform_batch(self, lfs):
+        """Perform action on a batch of faces/frames.
+
+        The default implementation simply loops over the faces. Subclasses may
+        override it to amortize per-call setup across the batch.
+
+        Parameters
+        ----------
+        lfs : list
+            List of ``LandmarkFace`` instances.
+
+        Returns
+        -------
+        new_lfs : list
+            List of ``LandmarkFace`` instances after taking the action.
+
+        dfs : list
+            List of ``DisplacementField`` instances, one per face.
+
+        """
+        results = [self.perform(lf) for lf in lfs]
+
+        return [r[0] for r in results], [r[1] for r in results]
+
+    @staticmethod
+    def _ref_offsets(lf, specs, scale, reference_space):
+        """Compute per-landmark offsets for compiled specs.
+
+        Shared by all spec-based actions so that a perform call goes straight
+        from the compiled table to the offsets without intermediate
+        ``Lambda``/``AbsoluteMove`` instances.
+
+        Parameters
+        ----------
+        lf : LandmarkFace
+            Instance of a ``LandmarkFace``.
+
+        specs : tuple
+            Compiled `(keys, dirs, props)` table - see ``_compile_specs``.
+
+        scale : float
+            Absolute norm of the maximum shift.
+
+        reference_space : ReferenceSpace
+            Reference space to compute the shifts in.
+
+        Returns
+        -------
+        offsets : np.ndarray
+            Array of shape `(68, 2)` representing the shift of each landmark
+            in the input space.
+
+        """
+        keys, dirs, props = specs
+
+        ref_points = _estimate_cached(reference_space, lf)
+        ref_shifts = dirs * (props * scale)[:, None]
+
+        new_inp_points = reference_space.ref2inp(ref_points[keys] + ref_shifts)
+
+        offsets = np.zeros((68, 2))
+        offsets[keys] = new_inp_points - lf.points[keys]
+
+        return offsets
+
     @staticmethod
     def pts2inst(new_points, lf, **interpolation_kwargs):
         """Generate instance of LandmarkFace via interpolation.
@@ -102,6 +230,42 @@ class AbsoluteMove(Action):
         self.x_shifts = x_shifts or {}
         self.y_shifts = y_shifts or {}
 
+        # Precomputed key and value arrays allowing for a single fancy-indexed
+        # assignment in `perform` rather than a Python loop per entry.
+        self._x_keys = np.fromiter(self.x_shifts.keys(), dtype=np.intp)
+        self._x_vals = np.fromiter(self.x_shifts.values(), dtype=np.float64)
+        self._y_keys = np.fromiter(self.y_shifts.keys(), dtype=np.intp)
+        self._y_vals = np.fromiter(self.y_shifts.values(), dtype=np.float64)
+
+        self._offsets = None
+
+    @classmethod
+    def from_offsets(cls, offsets):
+        """Construct directly from an offsets array.
+
+        Internal constructor meant for other actions that already hold the
+        offsets as an array and want to avoid the dict round-trip.
+
+        Parameters
+        ----------
+        offsets : np.ndarray
+            Array of shape `(68, 2)` representing the x and y shifts of all
+            landmarks.
+
+        Returns
+        -------
+        absolute_move : AbsoluteMove
+            Instance of ``AbsoluteMove`` performing the given offsets.
+
+        """
+        self = cls.__new__(cls)
+
+        self.x_shifts = {}
+        self.y_shifts = {}
+        self._offsets = offsets
+
+        return self
+
     def perform(self, lf):
         """Perform absolute move.
 
@@ -122,14 +286,13 @@ class AbsoluteMove(Action):
             new image.
 
         """
-        offsets = np.zeros((68, 2))
+        if self._offsets is not None:
+            offsets = self._offsets
+        else:
+            offsets = np.zeros((68, 2))
 
-        # x shifts
-        for k, v in self.x_shifts.items():
-            offsets[k, 0] = v
-        # y shifts
-        for k, v in self.y_shifts.items():
-            offsets[k, 1] = v
+            offsets[self._x_keys, 0] = self._x_vals
+            offsets[self._y_keys, 1] = self._y_vals
 
         new_points = lf.points + offsets
 
@@ -146,14 +309,17 @@ class Lambda(Action):
     scale : float
         Absolute norm of the maximum shift. All the remaining shifts are scaled linearly.
 
-    specs : dict
-        Dictionary where keyrs represent either the index or a name of the landmark.
+    specs : dict or tuple
+        If dict then keys represent either the index or a name of the landmark.
         The values are tuples of two elements:
             1) Angle in degrees.
             2) Proportional shift. Only the relative size towards other landmarks matters.
+        If tuple then assumed to be precompiled via ``_compile_specs``.
 
     reference_space : None or ReferenceSpace
-        Reference space to be used.
+        Reference space to be used. Note that the instance doubles as a cache -
+        the estimate for a given ``LandmarkFace`` is computed once and reused
+        by subsequent actions sharing the same reference space.
 
     """
 
@@ -163,6 +329,13 @@ class Lambda(Action):
         self.specs = specs
         self.reference_space = reference_space or DefaultRS()
 
+        # Resolve landmark names and hoist the trigonometry out of `perform`
+        # so that repeated calls only scale the precomputed direction vectors.
+        if isinstance(specs, dict):
+            specs = _compile_specs(specs)
+
+        self._keys, self._dirs, self._props = specs
+
     def perform(self, lf):
         """Perform action.
 
@@ -180,30 +353,56 @@ class Lambda(Action):
             Displacement field representing the transformation between the old and new image.
 
         """
-        self.reference_space.estimate(lf)
-        ref_points = self.reference_space.inp2ref(lf.points)
+        offsets = self._ref_offsets(
+            lf,
+            (self._keys, self._dirs, self._props),
+            self.scale,
+            self.reference_space,
+        )
 
-        # Create entry for AbsoluteMove
-        x_shifts = {}
-        y_shifts = {}
+        return self.pts2inst(lf.points + offsets, lf)
 
-        for k, (angle, prop) in self.specs.items():
-            key = k if isinstance(k, int) else LANDMARK_NAMES[k]
+    def perform_batch(self, lfs):
+        """Perform action on a batch of faces/frames.
 
-            ref_shift = (
-                np.array([[np.cos(np.radians(angle)), np.sin(np.radians(angle))]])
-                * prop
-                * self.scale
-            )
-            new_inp_point = self.reference_space.ref2inp(ref_points[key] + ref_shift)[0]
-            shift = new_inp_point - lf.points[key]
+        All the reference space math runs as broadcast tensor operations over
+        the whole batch; only the final warp stays per frame. The reference
+        space is estimated on the first face, so the batch is assumed to hold
+        the same face across frames.
+
+        Parameters
+        ----------
+        lfs : list
+            List of ``LandmarkFace`` instances.
 
-            x_shifts[key] = shift[0]
-            y_shifts[key] = shift[1]
+        Returns
+        -------
+        new_lfs : list
+            List of ``LandmarkFace`` instances after taking the action.
+
+        dfs : list
+            List of ``DisplacementField`` instances, one per face.
+
+        """
+        pts = np.stack([lf.points for lf in lfs])  # (F, 68, 2)
+
+        _estimate_cached(self.reference_space, lfs[0])
+        ref_points = self.reference_space.inp2ref_batch(pts)
+
+        ref_shifts = self._dirs * (self._props * self.scale)[:, None]
+
+        new_inp_points = self.reference_space.ref2inp_batch(
+            ref_points[:, self._keys] + ref_shifts[None]
+        )
+
+        deltas = np.zeros_like(pts, dtype=np.float64)
+        deltas[:, self._keys] = new_inp_points - pts[:, self._keys]
 
-        am = AbsoluteMove(x_shifts=x_shifts, y_shifts=y_shifts)
+        results = [
+            self.pts2inst(lf.points + delta, lf) for lf, delta in zip(lfs, deltas)
+        ]
 
-        return am.perform(lf)
+        return [r[0] for r in results], [r[1] for r in results]
 
 
 class Chubbify(Action):
@@ -216,20 +415,8 @@ class Chubbify(Action):
 
     """
 
-    def __init__(self, scale=0.2):
-        """Construct."""
-        self.scale = scale
-
-    def perform(self, lf):
-        """Perform an action.
-
-        Parameters
-        ----------
-        lf : LandmarkFace
-            Instance of a ``LandmarkFace``.
-
-        """
-        specs = {
+    _SPECS = _compile_specs(
+        {
             "LOWER_TEMPLE_L": (170, 0.4),
             "LOWER_TEMPLE_R": (10, 0.4),
             "UPPERMOST_CHEEK_L": (160, 1),
@@ -244,8 +431,25 @@ class Chubbify(Action):
             "CHIN_R": (60, 0.7),
             "CHIN": (90, 0.7),
         }
+    )
 
-        return Lambda(self.scale, specs).perform(lf)
+    def __init__(self, scale=0.2):
+        """Construct."""
+        self.scale = scale
+        self._reference_space = DefaultRS()
+
+    def perform(self, lf):
+        """Perform an action.
+
+        Parameters
+        ----------
+        lf : LandmarkFace
+            Instance of a ``LandmarkFace``.
+
+        """
+        offsets = self._ref_offsets(lf, self._SPECS, self.scale, self._reference_space)
+
+        return self.pts2inst(lf.points + offsets, lf)
 
 
 class LinearTransform(Action):
@@ -272,7 +476,10 @@ class LinearTransform(Action):
         Translation in the y direction.
 
     reference_space : None or pychubby.reference.ReferenceSpace
-        Instace of the ``ReferenceSpace`` class.
+        Instace of the ``ReferenceSpace`` class. Note that the instance
+        doubles as a cache - the estimate for a given ``LandmarkFace`` is
+        computed once and reused by subsequent actions sharing the same
+        reference space.
 
     """
 
@@ -295,6 +502,18 @@ class LinearTransform(Action):
         self.translation_y = translation_y
         self.reference_space = reference_space or DefaultRS()
 
+        # Explicit (2, 3) affine matrix mirroring skimage's AffineTransform
+        # convention, built once so that `perform` is a plain matmul.
+        c, s = np.cos(rotation), np.sin(rotation)
+        t = np.tan(shear)
+
+        self._matrix = np.array(
+            [
+                [scale_x * c, -scale_y * (s + c * t), translation_x],
+                [scale_x * s, scale_y * (c - s * t), translation_y],
+            ]
+        )
+
     def perform(self, lf):
         """Perform action.
 
@@ -312,27 +531,17 @@ class LinearTransform(Action):
             Displacement field representing the transformation between the old and new image.
 
         """
-        # estimate reference space
-        self.reference_space.estimate(lf)
+        # estimate reference space and map landmarks into it (cached per face)
+        ref_points = _estimate_cached(self.reference_space, lf)
 
-        # transform reference space landmarks
-        ref_points = self.reference_space.inp2ref(lf.points)
-
-        tform = AffineTransform(
-            scale=(self.scale_x, self.scale_y),
-            rotation=self.rotation,
-            shear=self.shear,
-            translation=(self.translation_x, self.translation_y),
-        )
-        tformed_ref_points = tform(ref_points)
+        tformed_ref_points = ref_points @ self._matrix[:, :2].T + self._matrix[:, 2]
 
         # ref2inp
         tformed_inp_points = self.reference_space.ref2inp(tformed_ref_points)
 
-        x_shifts = {i: (tformed_inp_points[i] - lf[i])[0] for i in range(68)}
-        y_shifts = {i: (tformed_inp_points[i] - lf[i])[1] for i in range(68)}
+        deltas = tformed_inp_points - lf.points
 
-        return AbsoluteMove(x_shifts=x_shifts, y_shifts=y_shifts).perform(lf)
+        return AbsoluteMove.from_offsets(deltas).perform(lf)
 
 
 class Multiple(Action):
@@ -431,9 +640,33 @@ class OpenEyes(Action):
 
     """
 
+    _SPECS = _compile_specs(
+        {
+            "INNER_EYE_LID_R": (-100, 0.8),
+            "OUTER_EYE_LID_R": (-80, 1),
+            "INNER_EYE_BOTTOM_R": (100, 0.5),
+            "OUTER_EYE_BOTTOM_R": (80, 0.5),
+            "INNERMOST_EYEBROW_R": (-100, 1),
+            "INNER_EYEBROW_R": (-100, 1),
+            "MIDDLE_EYEBROW_R": (-100, 1),
+            "OUTER_EYEBROW_R": (-100, 1),
+            "OUTERMOST_EYEBROW_R": (-100, 1),
+            "INNER_EYE_LID_L": (-80, 0.8),
+            "OUTER_EYE_LID_L": (-100, 1),
+            "INNER_EYE_BOTTOM_L": (80, 0.5),
+            "OUTER_EYE_BOTTOM_L": (10, 0.5),
+            "INNERMOST_EYEBROW_L": (-80, 1),
+            "INNER_EYEBROW_L": (-80, 1),
+            "MIDDLE_EYEBROW_L": (-80, 1),
+            "OUTER_EYEBROW_L": (-80, 1),
+            "OUTERMOST_EYEBROW_L": (-80, 1),
+        }
+    )
+
     def __init__(self, scale=0.1):
         """Construct."""
         self.scale = scale
+        self._reference_space = DefaultRS()
 
     def perform(self, lf):
         """Perform action.
@@ -452,27 +685,9 @@ class OpenEyes(Action):
             Displacement field representing the transformation between the old and new image.
 
         """
-        specs = {
-            "INNER_EYE_LID_R": (-100, 0.8),
-            "OUTER_EYE_LID_R": (-80, 1),
-            "INNER_EYE_BOTTOM_R": (100, 0.5),
-            "OUTER_EYE_BOTTOM_R": (80, 0.5),
-            "INNERMOST_EYEBROW_R": (-100, 1),
-            "INNER_EYEBROW_R": (-100, 1),
-            "MIDDLE_EYEBROW_R": (-100, 1),
-            "OUTER_EYEBROW_R": (-100, 1),
-            "OUTERMOST_EYEBROW_R": (-100, 1),
-            "INNER_EYE_LID_L": (-80, 0.8),
-            "OUTER_EYE_LID_L": (-100, 1),
-            "INNER_EYE_BOTTOM_L": (80, 0.5),
-            "OUTER_EYE_BOTTOM_L": (10, 0.5),
-            "INNERMOST_EYEBROW_L": (-80, 1),
-            "INNER_EYEBROW_L": (-80, 1),
-            "MIDDLE_EYEBROW_L": (-80, 1),
-            "OUTER_EYEBROW_L": (-80, 1),
-            "OUTERMOST_EYEBROW_L": (-80, 1),
-        }
-        return Lambda(self.scale, specs=specs).perform(lf)
+        offsets = self._ref_offsets(lf, self._SPECS, self.scale, self._reference_space)
+
+        return self.pts2inst(lf.points + offsets, lf)
 
 
 class Pipeline(Action):
@@ -522,28 +737,52 @@ class Pipeline(Action):
         return lf_composed, df_composed
 
 
-class RaiseEyebrow(Action):
-    """Raise an eyebrow.
+class FusedPipeline(Action):
+    """Fuse multiple spec-based actions into a single warp.
+
+    Unlike ``Pipeline``, which warps the image once per step and composes the
+    displacement fields, the shifts of all steps are summed in the reference
+    space and a single displacement field is generated - one interpolation
+    pass instead of one per step.
+
+    Note that this is only equivalent to the sequential pipeline for small
+    offsets; for large ones the composition order starts to matter.
 
     Parameters
     ----------
-    scale : float
-        Absolute shift size in the reference space.
+    steps : list
+        List of actions to fuse. Each step needs to be spec-based - either a
+        ``Lambda`` or one of the built-in actions compiled via
+        ``_compile_specs`` (e.g. ``Chubbify``, ``Smile``, ``OpenEyes``).
 
-    side : str, {'left', 'right', 'both'}
-        Which eyebrow to raise.
+    reference_space : None or ReferenceSpace
+        Reference space to be used.
 
     """
 
-    def __init__(self, scale=0.1, side="both"):
+    def __init__(self, steps, reference_space=None):
         """Construct."""
-        self.scale = scale
-        self.side = side
+        self.steps = steps
+        self.reference_space = reference_space or DefaultRS()
 
-        if self.side not in {"left", "right", "both"}:
-            raise ValueError(
-                "Allowed side options are 'left', 'right' and 'both'.".format(self.side)
-            )
+        for a in steps:
+            if self._get_specs(a) is None:
+                raise TypeError(
+                    "All steps need to be spec-based actions, got {}".format(type(a))
+                )
+
+    @staticmethod
+    def _get_specs(action):
+        """Extract the compiled `(keys, dirs, props)` table of an action."""
+        if isinstance(action, Lambda):
+            return action._keys, action._dirs, action._props
+
+        specs = getattr(action, '_specs', None) or getattr(action, '_SPECS', None)
+
+        if specs is None or not hasattr(action, 'scale'):
+            return None
+
+        return specs
 
     def perform(self, lf):
         """Perform action.
@@ -562,6 +801,43 @@ class RaiseEyebrow(Action):
             Displacement field representing the transformation between the old and new image.
 
         """
+        ref_points = _estimate_cached(self.reference_space, lf)
+
+        ref_shift_total = np.zeros((68, 2))
+        for a in self.steps:
+            keys, dirs, props = self._get_specs(a)
+            ref_shift_total[keys] += dirs * (props * a.scale)[:, None]
+
+        new_inp_points = self.reference_space.ref2inp(ref_points + ref_shift_total)
+        offsets = new_inp_points - lf.points
+
+        return AbsoluteMove.from_offsets(offsets).perform(lf)
+
+
+class RaiseEyebrow(Action):
+    """Raise an eyebrow.
+
+    Parameters
+    ----------
+    scale : float
+        Absolute shift size in the reference space.
+
+    side : str, {'left', 'right', 'both'}
+        Which eyebrow to raise.
+
+    """
+
+    def __init__(self, scale=0.1, side="both"):
+        """Construct."""
+        self.scale = scale
+        self.side = side
+        self._reference_space = DefaultRS()
+
+        if self.side not in {"left", "right", "both"}:
+            raise ValueError(
+                "Allowed side options are 'left', 'right' and 'both'.".format(self.side)
+            )
+
         sides = []
         if self.side in {"both", "left"}:
             sides.append("L")
@@ -581,7 +857,28 @@ class RaiseEyebrow(Action):
                 }
             )
 
-        return Lambda(self.scale, specs).perform(lf)
+        self._specs = _compile_specs(specs)
+
+    def perform(self, lf):
+        """Perform action.
+
+        Parameters
+        ----------
+        lf : LandmarkFace
+            Instance of a ``LandmarkFace`` before taking the action.
+
+        Returns
+        -------
+        new_lf : LandmarkFace
+            Instance of a ``LandmarkFace`` after taking the action.
+
+        df : DisplacementField
+            Displacement field representing the transformation between the old and new image.
+
+        """
+        offsets = self._ref_offsets(lf, self._specs, self.scale, self._reference_space)
+
+        return self.pts2inst(lf.points + offsets, lf)
 
 
 class Smile(Action):
@@ -594,9 +891,21 @@ class Smile(Action):
 
     """
 
+    _SPECS = _compile_specs(
+        {
+            "OUTSIDE_MOUTH_CORNER_L": (-110, 1),
+            "OUTSIDE_MOUTH_CORNER_R": (-70, 1),
+            "INSIDE_MOUTH_CORNER_L": (-110, 0.8),
+            "INSIDE_MOUTH_CORNER_R": (-70, 0.8),
+            "OUTER_OUTSIDE_UPPER_LIP_L": (-100, 0.3),
+            "OUTER_OUTSIDE_UPPER_LIP_R": (-80, 0.3),
+        }
+    )
+
     def __init__(self, scale=0.1):
         """Construct."""
         self.scale = scale
+        self._reference_space = DefaultRS()
 
     def perform(self, lf):
         """Perform action.
@@ -615,16 +924,9 @@ class Smile(Action):
             Displacement field representing the transformation between the old and new image.
 
         """
-        specs = {
-            "OUTSIDE_MOUTH_CORNER_L": (-110, 1),
-            "OUTSIDE_MOUTH_CORNER_R": (-70, 1),
-            "INSIDE_MOUTH_CORNER_L": (-110, 0.8),
-            "INSIDE_MOUTH_CORNER_R": (-70, 0.8),
-            "OUTER_OUTSIDE_UPPER_LIP_L": (-100, 0.3),
-            "OUTER_OUTSIDE_UPPER_LIP_R": (-80, 0.3),
-        }
+        offsets = self._ref_offsets(lf, self._SPECS, self.scale, self._reference_space)
 
-        return Lambda(self.scale, specs).perform(lf)
+        return self.pts2inst(lf.points + offsets, lf)
 
 
 class StretchNostrils(Action):
@@ -637,9 +939,12 @@ class StretchNostrils(Action):
 
     """
 
+    _SPECS = _compile_specs({"OUTER_NOSTRIL_L": (-135, 1), "OUTER_NOSTRIL_R": (-45, 1)})
+
     def __init__(self, scale=0.1):
         """Construct."""
         self.scale = scale
+        self._reference_space = DefaultRS()
 
     def perform(self, lf):
         """Perform action.
@@ -658,6 +963,6 @@ class StretchNostrils(Action):
             Displacement field representing the transformation between the old and new image.
 
         """
-        specs = {"OUTER_NOSTRIL_L": (-135, 1), "OUTER_NOSTRIL_R": (-45, 1)}
+        offsets = self._ref_offsets(lf, self._SPECS, self.scale, self._reference_space)
 
-        return Lambda(self.scale, specs).perform(lf)
+        return self.pts2inst(lf.points + offsets, lf)
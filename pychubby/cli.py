@@ -8,7 +8,7 @@ import matplotlib.pyplot as plt
 import pychubby.actions
 from pychubby.detect import LandmarkFace
 
-EXCLUDED_ACTIONS = ["Action", "AbsoluteMove", "Lambda", "Multiple", "Pipeline"]
+EXCLUDED_ACTIONS = ["Action", "AbsoluteMove", "FusedPipeline", "Lambda", "Multiple", "Pipeline"]
 ALL_ACTIONS = [
     m[0]
     for m in inspect.getmembers(pychubby.actions, inspect.isclass)
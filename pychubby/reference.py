@@ -21,6 +21,44 @@ class ReferenceSpace(ABC):
     def inp2ref(*args, **kwargs):
         """Transform from input to reference."""
 
+    def ref2inp_batch(self, coords):
+        """Transform a batch of coordinate sets from reference to input space.
+
+        Parameters
+        ----------
+        coords : np.ndarray
+            Array of shape `(F, N, 2)` representing `F` sets of reference coordinates.
+
+        Returns
+        -------
+        tformed_coords : np.ndarray
+            Array of shape `(F, N, 2)` of input space coordinates corresponding
+            elementwise to `coords`.
+
+        """
+        flat = coords.reshape(-1, 2)
+
+        return self.ref2inp(flat).reshape(coords.shape)
+
+    def inp2ref_batch(self, coords):
+        """Transform a batch of coordinate sets from input to reference space.
+
+        Parameters
+        ----------
+        coords : np.ndarray
+            Array of shape `(F, N, 2)` representing `F` sets of input space coordinates.
+
+        Returns
+        -------
+        tformed_coords : np.ndarray
+            Array of shape `(F, N, 2)` of reference space coordinates corresponding
+            elementwise to `coords`.
+
+        """
+        flat = coords.reshape(-1, 2)
+
+        return self.inp2ref(flat).reshape(coords.shape)
+
 
 class DefaultRS(ReferenceSpace):
     """Default reference space.
@@ -3,8 +3,9 @@
 import numpy as np
 import pytest
 
-from pychubby.actions import (Action, AbsoluteMove, Chubbify, Lambda, LinearTransform, Multiple,
-                              Pipeline, RaiseEyebrow, Smile, OpenEyes, StretchNostrils)
+from pychubby.actions import (Action, AbsoluteMove, Chubbify, FusedPipeline, Lambda,
+                              LinearTransform, Multiple, Pipeline, RaiseEyebrow, Smile,
+                              OpenEyes, StretchNostrils)
 from pychubby.base import DisplacementField
 from pychubby.detect import LandmarkFace, LandmarkFaces
 
@@ -79,6 +80,30 @@ class TestAbsoluteMove:
                 assert np.allclose(new_points[i], old_points[i])
 
 
+class TestFusedPipeline:
+    """Collection of tests focused on the ``FusedPipeline`` action."""
+
+    def test_overall(self, random_lf):
+        a = FusedPipeline([Smile(), Chubbify()])
+
+        new_lf, df = a.perform(random_lf)
+
+        assert df.is_valid
+
+    def test_single_step_matches_plain(self, random_lf):
+        plain = Smile()
+        fused = FusedPipeline([Smile()])
+
+        _, df_plain = plain.perform(random_lf)
+        _, df_fused = fused.perform(random_lf)
+
+        assert df_plain == df_fused
+
+    def test_wrong_steps(self):
+        with pytest.raises(TypeError):
+            FusedPipeline([Smile(), LinearTransform()])
+
+
 class TestLambda:
     """Collection of tests focused on the ``Lambda`` action."""
 
@@ -100,6 +125,28 @@ class TestLambda:
         assert not np.allclose(df.delta_x, np.zeros_like(df.delta_x))
         assert not np.allclose(df.delta_y, np.zeros_like(df.delta_y))
 
+    def test_batch_matches_single(self, random_lf):
+
+        a = Lambda(0.5, {'CHIN': (90, 2)})
+
+        new_lf, df = a.perform(random_lf)
+        new_lfs, dfs = a.perform_batch([random_lf, random_lf])
+
+        assert len(new_lfs) == len(dfs) == 2
+        assert all(df == df_batch for df_batch in dfs)
+
+    def test_batch_does_not_corrupt_estimate_cache(self, random_lf):
+        lf_other = LandmarkFace(random_lf.points + np.random.random((68, 2)),
+                                random_lf.img)
+
+        a = Lambda(0.5, {'CHIN': (90, 2)})
+
+        new_lf_before, _ = a.perform(random_lf)
+        a.perform_batch([lf_other])
+        new_lf_after, _ = a.perform(random_lf)
+
+        assert np.allclose(new_lf_before.points, new_lf_after.points)
+
 
 class TestChubbify:
     """Collection of tests focused on the ``Chubbify`` action."""
@@ -134,6 +181,17 @@ class TestLinearTransform:
         assert not np.allclose(df.delta_x, np.zeros_like(df.delta_x))
         assert not np.allclose(df.delta_y, np.zeros_like(df.delta_y))
 
+    def test_matrix_matches_skimage(self):
+        from skimage.transform import AffineTransform
+
+        a = LinearTransform(scale_x=1.3, scale_y=0.8, rotation=0.4, shear=0.2,
+                            translation_x=2, translation_y=3)
+
+        tform = AffineTransform(scale=(1.3, 0.8), rotation=0.4, shear=0.2,
+                                translation=(2, 3))
+
+        assert np.allclose(a._matrix, tform.params[:2])
+
 
 class TestOpenEyes:
     """Collection of tests focused on the ``OpenEyes`` action."""
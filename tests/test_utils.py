@@ -1,8 +1,9 @@
 """Collections of tests focused on the utils.py module"""
 
+import numpy as np
 import pytest
 
-from pychubby.utils import points_to_rectangle_mask
+from pychubby.utils import points_to_rectangle_mask, points_to_rectangle_mask_packed
 
 
 class TestPointsToRectangleMask:
@@ -27,3 +28,22 @@ class TestPointsToRectangleMask:
 
         assert out.shape == shape
         assert out.sum() == -4 + 2 * (3 + bottom_right[0] - top_left[0]) + 2 * (3 + bottom_right[1] - top_left[1])
+
+
+class TestPointsToRectangleMaskPacked:
+    """Tests focused on the `points_to_rectangle_mask_packed` method."""
+
+    def test_roundtrip(self):
+        shape = (13, 15)
+        top_left = (2, 3)
+        bottom_right = (4, 9)
+
+        mask = points_to_rectangle_mask(shape, top_left, bottom_right)
+        packed, packed_shape = points_to_rectangle_mask_packed(shape, top_left, bottom_right)
+
+        assert packed.dtype == np.uint8
+        assert packed_shape == shape
+
+        unpacked = np.unpackbits(packed)[:shape[0] * shape[1]].reshape(shape).astype(bool)
+
+        assert np.array_equal(unpacked, mask)